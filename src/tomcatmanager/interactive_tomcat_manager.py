@@ -31,8 +31,10 @@ import ast
 import configparser
 import contextlib
 import enum
+import functools
 import getpass
 import http.client
+import json
 
 import importlib.resources as importlib_resources
 
@@ -44,14 +46,22 @@ except AttributeError:  # pragma: nocover
     # pylint: disable=import-error
     import importlib_resources  # type: ignore
 
-import os
+try:
+    import tomllib
+except ImportError:  # pragma: nocover
+    # python < 3.11 doesn't have tomllib in the standard library, so we
+    # use tomli from pypi, which has the same api
+    # pylint: disable=import-error
+    import tomli as tomllib  # type: ignore
+
 import pathlib
+import shlex
 import shutil
+import subprocess
 import sys
 import textwrap
 import traceback
-import xml.dom.minidom
-from typing import Callable, Any, List, Dict
+from typing import Callable, Any, List, Dict, Optional, Tuple
 
 import appdirs
 import cmd2
@@ -59,14 +69,79 @@ import requests
 import rich
 import rich.console
 import rich.spinner
-import rich.syntax
 import rich.progress
 from rich_argparse import RichHelpFormatter, RawDescriptionRichHelpFormatter
-import tomlkit
 
 import tomcatmanager as tm
 
 
+# horizontal line used to separate sections of help and other output
+_HELP_RULE = "─" * 72
+
+# shown by the license command
+_MIT_LICENSE = """\
+Copyright 2007 Jared Crapo
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+def _cached_parser(builder: Callable) -> property:
+    """
+    Decorator to turn a method which builds an argument parser into a
+    property which only builds it once per instance
+
+    cmd2 evaluates every property of the instance during its __init__(),
+    so functools.cached_property would build all the parsers at startup.
+    See ``InteractiveTomcatManager.cached_parser()`` for how we avoid that.
+    """
+
+    @functools.wraps(builder)
+    def getter(self):
+        return self.cached_parser(builder.__name__, lambda: builder(self))
+
+    return property(getter)
+
+
+def _to_bool(val: Any) -> bool:
+    """Converts anything to a boolean based on its value.
+
+    :param val: value being converted
+    :return: boolean value expressed in the passed in value
+    :raises: ValueError if the string can not be cast to a boolen
+
+    This has to be able to accommodate TOML-style bools, as well as
+    ini-style bools. That's why we lowercase the input before testing.
+    """
+    if isinstance(val, str):
+        if val.lower() == "true":
+            return True
+        if val.lower() == "false":
+            return False
+        raise ValueError("syntax error: must be 'true' or 'false'")
+
+    if isinstance(val, bool):
+        return val
+
+    return bool(val)
+
+
 # pylint: disable=too-many-public-methods, too-many-instance-attributes
 class InteractiveTomcatManager(cmd2.Cmd):
     """An interactive command line tool for the Tomcat Manager web application.
@@ -105,6 +180,54 @@ class InteractiveTomcatManager(cmd2.Cmd):
         "off": False,
     }
 
+    # cmd2 only reads this, so we can share one dictionary
+    _SHORTCUTS = {"?": "help", "!": "shell", "$?": "exit_code"}
+
+    # name of the method which handles each action of the config command
+    _CONFIG_ACTIONS = {
+        "edit": "_config_edit",
+        "file": "_config_file",
+        "convert": "_config_convert",
+    }
+
+    # settables from cmd2 we don't use, or which we replace with our own;
+    # not all versions of cmd2 have all of these
+    _REMOVED_SETTABLES = (
+        "max_completion_items",
+        "always_show_hint",
+        "allow_style",
+        "feedback_to_output",
+        "quiet",
+        "debug",
+        "echo",
+        "editor",
+        "prompt",
+    )
+
+    # name, type, and description of each of our settables
+    _SETTABLES = (
+        ("quiet", _to_bool, "suppress all feedback and status output"),
+        ("debug", _to_bool, "show stack trace for exceptions"),
+        ("echo", _to_bool, "for piped input, echo command to output"),
+        ("editor", str, "program used to edit files"),
+        (
+            "status_to_stdout",
+            bool,
+            "status information to stdout instead of stderr",
+        ),
+        ("status_prefix", str, "string to prepend to all status output"),
+        ("prompt", str, "displays before accepting user input"),
+        ("timing", _to_bool, "report execution time upon command completion"),
+        ("timeout", float, "seconds to wait for HTTP connections"),
+        ("status_suffix", str, "suffix to append to status messages"),
+        (
+            "status_animation",
+            str,
+            "style of activity animation from rich.spinner",
+        ),
+        ("theme", str, "color scheme"),
+    )
+
     # list of known scopes that themes can apply color to
     THEME_SCOPES = [
         "tm.error",
@@ -143,7 +266,14 @@ class InteractiveTomcatManager(cmd2.Cmd):
     # for configuration
     app_name = "tomcat-manager"
     app_author = "tomcatmanager"
-    config = tomlkit.loads("")
+    config: Dict[str, Any] = {}
+
+    _appdirs = None
+    # cache of the resolved path, see _resolved_user_config_dir()
+    _user_config_dir: Optional[pathlib.Path] = None
+
+    # cache of sorted settable names, see _sorted_settable_names()
+    _sorted_settables: Optional[Tuple[str, ...]] = None
 
     @property
     def status_to_stdout(self) -> bool:
@@ -215,107 +345,32 @@ class InteractiveTomcatManager(cmd2.Cmd):
     # pylint: disable=too-many-statements
     def __init__(self, loadconfig=True):
         self.appdirs = appdirs.AppDirs(self.app_name, self.app_author)
-        shortcuts = {"?": "help", "!": "shell", "$?": "exit_code"}
 
         super().__init__(
             persistent_history_file=self.history_file,
             persistent_history_length=1000,
-            shortcuts=shortcuts,
+            shortcuts=self._SHORTCUTS,
             allow_cli_args=False,
             terminators=[],
             auto_load_commands=False,
             include_py=True,
         )
 
+        # argument parsers built by cached_parser(), usually through properties
+        # decorated with @_cached_parser
+        self._parsers = {}
+        # results of parsing no arguments, keyed by parser, see parse_args().
+        # every parser is built once and kept, so this stays small
+        self._noargs = {}
+
         self.self_in_py = True
 
-        to_remove = [
-            "max_completion_items",
-            "always_show_hint",
-            "allow_style",
-            "feedback_to_output",
-            "quiet",
-            "debug",
-            "echo",
-            "editor",
-            "prompt",
-        ]
-        for setting in to_remove:
-            try:
+        existing = self.settables
+        for setting in self._REMOVED_SETTABLES:
+            if setting in existing:
                 self.remove_settable(setting)
-            except KeyError:
-                pass
-
-        self.add_settable(
-            cmd2.Settable(
-                "quiet",
-                _to_bool,
-                "suppress all feedback and status output",
-                self,
-            )
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "debug",
-                _to_bool,
-                "show stack trace for exceptions",
-                self,
-            )
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "echo",
-                _to_bool,
-                "for piped input, echo command to output",
-                self,
-            )
-        )
-        self.add_settable(
-            cmd2.Settable("editor", str, "program used to edit files", self)
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "status_to_stdout",
-                bool,
-                "status information to stdout instead of stderr",
-                self,
-            )
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "status_prefix", str, "string to prepend to all status output", self
-            )
-        )
-        self.add_settable(
-            cmd2.Settable("prompt", str, "displays before accepting user input", self)
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "timing",
-                _to_bool,
-                "report execution time upon command completion",
-                self,
-            )
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "timeout", float, "seconds to wait for HTTP connections", self
-            )
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "status_suffix", str, "suffix to append to status messages", self
-            )
-        )
-        self.add_settable(
-            cmd2.Settable(
-                "status_animation",
-                str,
-                "style of activity animation from rich.spinner",
-                self,
-            )
-        )
-        self.add_settable(cmd2.Settable("theme", str, "color scheme", self))
+        for name, val_type, description in self._SETTABLES:
+            self.add_settable(cmd2.Settable(name, val_type, description, self))
 
         self.tomcat = tm.TomcatManager()
 
@@ -355,42 +410,9 @@ class InteractiveTomcatManager(cmd2.Cmd):
 
         :returns: True of the theme could be applied, False if not
         """
-        # the scopes have to be present in the theme, or else it generates
-        # errors. Create a theme with all the scopes set to 'none', which
-        # tells rich.style to apply no styling
-        tvalues = {}
-        for scope in self.THEME_SCOPES:
-            tvalues[scope] = "none"
-        # if we have a theme name given
-        if theme:
-            # find the ThemeLocation and path, we discard the former
-            # here, because we don't care
-            _, tfile = self._resolve_theme(theme)
-            if not tfile:
-                self.perror(f"unknown theme: '{theme}'")
-                return False
-
-            try:
-                with open(tfile, encoding="utf-8") as file_var:
-                    newvalues = tomlkit.load(file_var)
-            except (tomlkit.exceptions.TOMLKitError, OSError) as err:
-                self.perror(f"error loading theme: {err}")
-                return False
-
-            # apply the new values from the theme to tvalues
-            for scope in self.THEME_SCOPES:
-                parts = scope.split(".")
-                style = ""
-                try:
-                    if len(parts) == 2:
-                        style = newvalues[parts[0]][parts[1]]
-                    elif len(parts) == 3:
-                        style = newvalues[parts[0]][parts[1]][parts[2]]
-                except tomlkit.exceptions.NonExistentKey:
-                    # the theme file doesn't define that scope
-                    pass
-                if style:
-                    tvalues[scope] = style
+        tvalues = self._theme_values(theme)
+        if tvalues is None:
+            return False
         # copy the usage styles to the RichHelpFormatter class
         for style in ["prog", "groups", "args", "metavar", "help", "text", "syntax"]:
             RichHelpFormatter.styles[f"argparse.{style}"] = tvalues[f"tm.usage.{style}"]
@@ -402,15 +424,20 @@ class InteractiveTomcatManager(cmd2.Cmd):
 
         # recreate our console objects using the new theme
         try:
+            if theme:
+                rich_theme = rich.theme.Theme(tvalues)
+            else:
+                # this happens at least twice for every instance
+                rich_theme = self._empty_theme()
             self.console = rich.console.Console(
-                theme=rich.theme.Theme(tvalues),
+                theme=rich_theme,
                 markup=False,
                 emoji=False,
                 highlight=False,
             )
             self.error_console = rich.console.Console(
                 stderr=True,
-                theme=rich.theme.Theme(tvalues),
+                theme=rich_theme,
                 markup=False,
                 emoji=False,
                 highlight=False,
@@ -420,6 +447,59 @@ class InteractiveTomcatManager(cmd2.Cmd):
             return False
         return True
 
+    def _theme_values(self, theme: str) -> Optional[Dict[str, str]]:
+        """Read the style for every scope from a theme
+
+        :returns: a dictionary of styles keyed by scope, or None if the theme
+                  could not be loaded, in which case the error has been shown
+        """
+        # the scopes have to be present in the theme, or else it generates
+        # errors. Create a theme with all the scopes set to 'none', which
+        # tells rich.style to apply no styling
+        tvalues = {}
+        for scope in self.THEME_SCOPES:
+            tvalues[scope] = "none"
+        # if we don't have a theme name given, we are done
+        if not theme:
+            return tvalues
+
+        # find the ThemeLocation and path, we discard the former
+        # here, because we don't care
+        _, tfile = self._resolve_theme(theme)
+        if not tfile:
+            self.perror(f"unknown theme: '{theme}'")
+            return None
+
+        try:
+            with open(tfile, "rb") as file_var:
+                newvalues = tomllib.load(file_var)
+        except (tomllib.TOMLDecodeError, OSError) as err:
+            self.perror(f"error loading theme: {err}")
+            return None
+
+        # apply the new values from the theme to tvalues
+        for scope in self.THEME_SCOPES:
+            parts = scope.split(".")
+            style = ""
+            try:
+                if len(parts) == 2:
+                    style = newvalues[parts[0]][parts[1]]
+                elif len(parts) == 3:
+                    style = newvalues[parts[0]][parts[1]][parts[2]]
+            except KeyError:
+                # the theme file doesn't define that scope
+                pass
+            if style:
+                tvalues[scope] = style
+        return tvalues
+
+    # pylint: disable=method-cache-max-size-none
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _empty_theme(cls) -> rich.theme.Theme:
+        """Build a rich theme which applies no styling to any of our scopes"""
+        return rich.theme.Theme({scope: "none" for scope in cls.THEME_SCOPES})
+
     def _resolve_theme(self, name: str) -> pathlib.Path:
         """
         Find the path of the theme file for a given name.
@@ -460,15 +540,18 @@ class InteractiveTomcatManager(cmd2.Cmd):
             f"{self.status_prefix}{message}{self.status_suffix}",
             style="tm.status",
         )
+        if not self.status_animation or not cons.is_terminal:
+            # there is nothing to animate, so skip the live display and the
+            # thread it starts to refresh the screen, and just show the message
+            cons.print(msg)
+            return contextlib.nullcontext()
+
         text_column = rich.progress.RenderableColumn(msg)
-        if self.status_animation:
-            spinner_column = rich.progress.SpinnerColumn(
-                spinner_name=self.status_animation,
-                style="tm.animation",
-            )
-            progress = rich.progress.Progress(text_column, spinner_column, console=cons)
-        else:
-            progress = rich.progress.Progress(text_column, console=cons)
+        spinner_column = rich.progress.SpinnerColumn(
+            spinner_name=self.status_animation,
+            style="tm.animation",
+        )
+        progress = rich.progress.Progress(text_column, spinner_column, console=cons)
         # gotta have a task in order for the status spinner to render,
         # but the name we use here doesn't matter
         progress.add_task("notshown")
@@ -593,10 +676,42 @@ class InteractiveTomcatManager(cmd2.Cmd):
         # we don't use self.console because this already has ansi color codes in
         self.ppaged(argparser.format_help())
 
+    def cached_parser(self, name: str, builder: Callable[[], Any]) -> Any:
+        """
+        Return the parser cached under ``name``, building it on first use
+
+        :param name: key to cache the parser under
+        :param builder: called with no arguments to build the parser if it
+            isn't in the cache yet
+        :return: whatever ``builder`` returns, usually an
+            ``argparse.ArgumentParser``
+        """
+        # cmd2 looks at every property during its __init__(), before we have
+        # created self._parsers. The AttributeError raised here is expected:
+        # cmd2 ignores it, and it keeps cmd2 from building every parser at
+        # startup.
+        parsers = self._parsers
+        try:
+            return parsers[name]
+        except KeyError:
+            parser = builder()
+            parsers[name] = parser
+            return parser
+
     def parse_args(
         self, parser: argparse.ArgumentParser, argv: List
     ) -> argparse.Namespace:
         """Use argparse to parse a list of arguments a-la sys.argv"""
+        if len(argv) == 1:
+            # commands are often entered without any arguments, and the
+            # result of parsing no arguments never changes for a given parser
+            try:
+                args = self._noargs[parser]
+                self.exit_code = self.EXIT_SUCCESS
+                return argparse.Namespace(**vars(args))
+            except KeyError:
+                pass
+
         # assume we get a usage error
         self.exit_code = self.EXIT_USAGE
         # argv includes the command name, the arg parser doesn't
@@ -609,13 +724,16 @@ class InteractiveTomcatManager(cmd2.Cmd):
             # we have to catch it
             raise cmd2.Cmd2ArgparseError from sysexit
 
+        if len(argv) == 1:
+            self._noargs[parser] = argparse.Namespace(**vars(args))
         # no usage error, assume success
         self.exit_code = self.EXIT_SUCCESS
         return args
 
     def raise_if_not_connected(self):
         """Print an error and throw an exception if we are not connected"""
-        if self.tomcat and self.tomcat.is_connected:
+        # self.tomcat is created in __init__() and never set to None
+        if self.tomcat.is_connected:
             return
         # we aren't connected, so make a fuss
         self.exit_code = self.EXIT_ERROR
@@ -645,24 +763,99 @@ class InteractiveTomcatManager(cmd2.Cmd):
 
         return out
 
-    def _help_section(self, title: str):
-        """Start a new help section and return a table for commands in that section"""
-        self.console.print("")
-        self.console.print(title, style="tm.help.category")
-        self.console.print("─" * 72, style="tm.help.border")
+    @staticmethod
+    def _help_section(sections: List, title: str) -> rich.table.Table:
+        """Add a new help section and return a table for commands in that section"""
         cmds = rich.table.Table(
             show_edge=False,
             box=None,
             padding=(0, 3, 0, 0),
             show_header=False,
         )
+        sections.append((title, cmds))
         return cmds
 
-    def _help_command(self, table, command, desc):
+    @staticmethod
+    def _help_command(table, command, desc):
         """Add a new command to a help table"""
         table.add_row(rich.text.Text(command, style="tm.help.command"), desc)
 
-    # pylint: disable=too-many-statements
+    # pylint: disable=method-cache-max-size-none
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _help_sections(cls) -> Tuple[Tuple[str, rich.table.Table], ...]:
+        """
+        Build the title and table of commands for each section of the help
+
+        The descriptions come from the docstrings of the commands, which don't
+        change, so we only have to build these once.
+        """
+        sections: List[Tuple[str, rich.table.Table]] = []
+        cmds = cls._help_section(sections, "Connecting to a Tomcat server")
+        cls._help_command(cmds, "connect", cls.do_connect.__doc__)
+        cls._help_command(cmds, "which", cls.do_which.__doc__)
+        cls._help_command(cmds, "disconnect", cls.do_disconnect.__doc__)
+
+        cmds = cls._help_section(sections, "Managing applications")
+        cls._help_command(cmds, "list", cls.do_list.__doc__)
+        cls._help_command(cmds, "deploy", cls.do_deploy.__doc__)
+        cls._help_command(cmds, "redeploy", cls.do_redeploy.__doc__)
+        cls._help_command(cmds, "undeploy", cls.do_undeploy.__doc__)
+        cls._help_command(cmds, "start", cls.do_start.__doc__)
+        cls._help_command(cmds, "stop", cls.do_stop.__doc__)
+        cls._help_command(cmds, "restart", cls.do_restart.__doc__)
+        cls._help_command(cmds, "  reload", "synonym for 'restart'")
+        cls._help_command(cmds, "sessions", cls.do_sessions.__doc__)
+        cls._help_command(cmds, "expire", cls.do_expire.__doc__)
+
+        cmds = cls._help_section(sections, "Server information")
+        cls._help_command(cmds, "findleakers", cls.do_findleakers.__doc__)
+        cls._help_command(cmds, "resources", cls.do_resources.__doc__)
+        cls._help_command(cmds, "serverinfo", cls.do_serverinfo.__doc__)
+        cls._help_command(cmds, "status", cls.do_status.__doc__)
+        cls._help_command(cmds, "threaddump", cls.do_threaddump.__doc__)
+        cls._help_command(cmds, "vminfo", cls.do_vminfo.__doc__)
+
+        cmds = cls._help_section(sections, "TLS configuration")
+        cls._help_command(
+            cmds, "sslconnectorciphers", cls.do_sslconnectorciphers.__doc__
+        )
+        cls._help_command(cmds, "sslconnectorcerts", cls.do_sslconnectorcerts.__doc__)
+        cls._help_command(
+            cmds,
+            "sslconnectortrustedcerts",
+            cls.do_sslconnectortrustedcerts.__doc__,
+        )
+        cls._help_command(cmds, "sslreload", cls.do_sslreload.__doc__)
+
+        cmds = cls._help_section(sections, "Settings, configuration, and tools")
+        cls._help_command(cmds, "settings", cls.do_settings.__doc__)
+        cls._help_command(cmds, "set", cls.do_set.__doc__)
+        cls._help_command(cmds, "config", cls.do_config.__doc__)
+        cls._help_command(cmds, "theme", cls.do_theme.__doc__)
+        cls._help_command(cmds, "edit", "edit a file in the preferred text editor")
+        cls._help_command(cmds, "exit_code", cls.do_exit_code.__doc__)
+        cls._help_command(
+            cmds,
+            "history",
+            "view, run, edit, and save previously entered commands",
+        )
+        cls._help_command(cmds, "py", "run an interactive python shell")
+        cls._help_command(cmds, "run_pyscript", "run a file containing a python script")
+        cls._help_command(
+            cmds, "shell", "execute a command in the operating system shell"
+        )
+        cls._help_command(cmds, "shortcuts", "show shortcuts for other commands")
+
+        cmds = cls._help_section(sections, "Other")
+        cls._help_command(cmds, "exit", cls.do_exit.__doc__)
+        cls._help_command(cmds, "  quit", cls.do_quit.__doc__)
+        cls._help_command(cmds, "help", cls.do_help.__doc__)
+        cls._help_command(cmds, "version", cls.do_version.__doc__)
+        cls._help_command(cmds, "license", cls.do_license.__doc__)
+
+        return tuple(sections)
+
     def do_help(self, args: cmd2.Statement):
         """show available commands, or help on a specific command"""
         if args:
@@ -680,99 +873,31 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 else:
                     self.exit_code = self.EXIT_ERROR
         else:
-            with self.console.pager(styles=True):
-                self.console.print("tomcat-manager", style="tm.help.command", end="")
-                self.console.print(
-                    " is a command line tool for managing a Tomcat server"
-                )
-                self.console.print()
-                helpcmd = rich.text.Text("Type '")
-                helpcmd.append("help", style="tm.help.command")
-                helpcmd.append(" ")
-                helpcmd.append("[command]", style="tm.help.args")
-                helpcmd.append("' for help on any command.")
-                self.console.print(helpcmd)
-                self.console.print()
-                self.console.print(
-                    "Here's a categorized list of all available commands:"
-                )
+            # collect everything and print it all at once, which is much
+            # faster than lots of calls to self.console.print()
+            helpcmd = rich.text.Text("Type '")
+            helpcmd.append("help", style="tm.help.command")
+            helpcmd.append(" ")
+            helpcmd.append("[command]", style="tm.help.args")
+            helpcmd.append("' for help on any command.")
+            output = [
+                rich.text.Text.assemble(
+                    ("tomcat-manager", "tm.help.command"),
+                    " is a command line tool for managing a Tomcat server",
+                ),
+                "",
+                helpcmd,
+                "",
+                "Here's a categorized list of all available commands:",
+            ]
+            for title, cmds in self._help_sections():
+                output.append("")
+                output.append(rich.text.Text(title, style="tm.help.category"))
+                output.append(rich.text.Text(_HELP_RULE, style="tm.help.border"))
+                output.append(cmds)
 
-                cmds = self._help_section("Connecting to a Tomcat server")
-                self._help_command(cmds, "connect", self.do_connect.__doc__)
-                self._help_command(cmds, "which", self.do_which.__doc__)
-                self._help_command(cmds, "disconnect", self.do_disconnect.__doc__)
-                self.console.print(cmds)
-
-                cmds = self._help_section("Managing applications")
-                self._help_command(cmds, "list", self.do_list.__doc__)
-                self._help_command(cmds, "deploy", self.do_deploy.__doc__)
-                self._help_command(cmds, "redeploy", self.do_redeploy.__doc__)
-                self._help_command(cmds, "undeploy", self.do_undeploy.__doc__)
-                self._help_command(cmds, "start", self.do_start.__doc__)
-                self._help_command(cmds, "stop", self.do_stop.__doc__)
-                self._help_command(cmds, "restart", self.do_restart.__doc__)
-                self._help_command(cmds, "  reload", "synonym for 'restart'")
-                self._help_command(cmds, "sessions", self.do_sessions.__doc__)
-                self._help_command(cmds, "expire", self.do_expire.__doc__)
-                self.console.print(cmds)
-
-                cmds = self._help_section("Server information")
-                self._help_command(cmds, "findleakers", self.do_findleakers.__doc__)
-                self._help_command(cmds, "resources", self.do_resources.__doc__)
-                self._help_command(cmds, "serverinfo", self.do_serverinfo.__doc__)
-                self._help_command(cmds, "status", self.do_status.__doc__)
-                self._help_command(cmds, "threaddump", self.do_threaddump.__doc__)
-                self._help_command(cmds, "vminfo", self.do_vminfo.__doc__)
-                self.console.print(cmds)
-
-                cmds = self._help_section("TLS configuration")
-                self._help_command(
-                    cmds, "sslconnectorciphers", self.do_sslconnectorciphers.__doc__
-                )
-                self._help_command(
-                    cmds, "sslconnectorcerts", self.do_sslconnectorcerts.__doc__
-                )
-                self._help_command(
-                    cmds,
-                    "sslconnectortrustedcerts",
-                    self.do_sslconnectortrustedcerts.__doc__,
-                )
-                self._help_command(cmds, "sslreload", self.do_sslreload.__doc__)
-                self.console.print(cmds)
-
-                cmds = self._help_section("Settings, configuration, and tools")
-                self._help_command(cmds, "settings", self.do_settings.__doc__)
-                self._help_command(cmds, "set", self.do_set.__doc__)
-                self._help_command(cmds, "config", self.do_config.__doc__)
-                self._help_command(cmds, "theme", self.do_theme.__doc__)
-                self._help_command(
-                    cmds, "edit", "edit a file in the preferred text editor"
-                )
-                self._help_command(cmds, "exit_code", self.do_exit_code.__doc__)
-                self._help_command(
-                    cmds,
-                    "history",
-                    "view, run, edit, and save previously entered commands",
-                )
-                self._help_command(cmds, "py", "run an interactive python shell")
-                self._help_command(
-                    cmds, "run_pyscript", "run a file containing a python script"
-                )
-                self._help_command(
-                    cmds, "shell", "execute a command in the operating system shell"
-                )
-                self._help_command(
-                    cmds, "shortcuts", "show shortcuts for other commands"
-                )
-                self.console.print(cmds)
-
-                cmds = self._help_section("Other")
-                self._help_command(cmds, "exit", self.do_exit.__doc__)
-                self._help_command(cmds, "  quit", self.do_quit.__doc__)
-                self._help_command(cmds, "help", self.do_help.__doc__)
-                self._help_command(cmds, "version", self.do_version.__doc__)
-                self._help_command(cmds, "license", self.do_license.__doc__)
-                self.console.print(cmds)
+            with self.console.pager(styles=True):
+                self.console.print(rich.console.Group(*output))
 
             self.exit_code = self.EXIT_SUCCESS
 
@@ -780,24 +905,14 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """do help for the deploy and redeploy commands"""
         # if we get here we know args.arg_list[0] is deploy or redeploy
         command = args.arg_list[0]
-        (parser, local_parser, server_parser, context_parser) = _deploy_parser(
-            command,
-            self.do_deploy.__doc__,
-            self.deploy_local,
-            self.deploy_server,
-            self.deploy_context,
-        )
+        (parser, _, _, _) = self._get_deploy_parsers(command)
         if len(args.arg_list) == 2:
             # help deploy local
             subcommand = args.arg_list[1]
             if subcommand in ["local", "server", "context"]:
                 # format help from subparser
-                (_, local_parser, server_parser, context_parser) = _deploy_parser(
-                    "deploy",
-                    self.do_deploy.__doc__,
-                    self.deploy_local,
-                    self.deploy_server,
-                    self.deploy_context,
+                (_, local_parser, server_parser, context_parser) = (
+                    self._get_deploy_parsers("deploy")
                 )
                 # this output is already formatted and knows about the length of
                 # the non-printing ascii color sequences. don't write it to
@@ -821,7 +936,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
     def _do_help_theme(self, args: cmd2.Statement):
         """do help for the theme command"""
         # if we get here we know args.arg_list[0] is 'theme'
-        parsers = self._build_theme_parsers()
+        parsers = self._theme_parsers()
         if len(args.arg_list) == 2:
             subcommand = args.arg_list[1]
             if subcommand in parsers:
@@ -841,7 +956,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
     # user accessable commands for configuration and settings
     #
     ###
-    @property
+    @_cached_parser
     def config_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the config command."""
         parser = argparse.ArgumentParser(
@@ -862,20 +977,48 @@ class InteractiveTomcatManager(cmd2.Cmd):
 
     def do_config(self, cmdline: cmd2.Statement):
         """edit or show the location of the user configuration file"""
-        args = self.parse_args(self.config_parser, cmdline.argv)
-
-        if args.action == "file":
-            self.poutput(self.config_file)
-            self.exit_code = self.EXIT_SUCCESS
-        elif args.action == "edit":
-            self._config_edit()
-        elif args.action == "convert":
-            self._config_convert()
+        actions = self._CONFIG_ACTIONS
+        if len(cmdline.argv) == 2 and cmdline.argv[1] in actions:
+            # a single valid action is by far the most common case, and
+            # we don't need argparse to figure out what to do with it
+            action = cmdline.argv[1]
+        else:
+            # let argparse deal with help and usage errors
+            action = self.parse_args(self.config_parser, cmdline.argv).action
+        getattr(self, actions[action])()
 
     def help_config(self):
         """Show help for the 'config' command"""
         self.show_help_from(self.config_parser)
 
+    def _config_file(self):
+        """Show the full path of the configuration file"""
+        self.poutput(self.config_file)
+        self.exit_code = self.EXIT_SUCCESS
+
+    def _run_editor(self, path: pathlib.Path) -> bool:
+        """
+        Open a file in the user's editor and wait for the editor to exit
+
+        The editor is run directly instead of through a shell, so we don't
+        have to worry about quoting. The whole editor setting is the name
+        or path of the program; it can't include arguments.
+
+        :return: True if the editor ran, False if it could not be started,
+            in which case the error has been shown and exit_code set
+        """
+        # shutil.which() honors PATHEXT on Windows, so an editor named
+        # 'code' finds 'code.cmd', which subprocess can run directly
+        editor = shutil.which(self.editor) or self.editor
+        self.pfeedback(f"executing {shlex.join([self.editor, str(path)])}")
+        try:
+            subprocess.run([editor, str(path)], check=False)
+        except OSError as err:
+            self.perror(f"could not run editor '{self.editor}': {err.strerror}")
+            self.exit_code = self.EXIT_ERROR
+            return False
+        return True
+
     def _config_edit(self):
         """
         Open the configuration file in an editor, and reload the configuration when the
@@ -893,9 +1036,8 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 configdir.mkdir(parents=True, exist_ok=True)
 
             # go edit the file
-            cmd = f'"{self.editor}" "{self.config_file}"'
-            self.pfeedback(f"executing {cmd}")
-            os.system(cmd)
+            if not self._run_editor(self.config_file):
+                return
 
             # read it back in and apply it
             self.pfeedback("reloading configuration file")
@@ -926,24 +1068,32 @@ class InteractiveTomcatManager(cmd2.Cmd):
             return
 
         self.pfeedback("converting old configuration file to new format")
+        # we only need tomlkit to write toml, which doesn't happen in most
+        # sessions, so don't import it until we need it
+        # pylint: disable=import-outside-toplevel
+        import tomlkit
+
         iniconfig = EvaluatingConfigParser()
         with open(self.config_file_old, "r", encoding="utf-8") as fobj:
             iniconfig.read_file(fobj)
             # convert it to a new toml file
             toml = tomlkit.document()
-            for section in dict(iniconfig).keys():
-                if section == "DEFAULT":
-                    pass
-                elif section == "settings":
+            # sections() leaves out the DEFAULT section, which we don't want
+            for section in iniconfig.sections():
+                # use the section proxy so values go through our get() method
+                inisection = iniconfig[section]
+                if section == "settings":
                     table = tomlkit.table()
-                    for param_name in dict(iniconfig[section]):
+                    # self.settables builds a new dictionary every time
+                    settables = self.settables
+                    for param_name in inisection:
                         # inifiles are untyped so everything is read from
                         # them as a string. this code converts the string
                         # to the proper type, so that it gets written into
                         # the toml file as the proper type
                         try:
-                            settable = self.settables[param_name]
-                            value = iniconfig[section][param_name]
+                            settable = settables[param_name]
+                            value = inisection[param_name]
                             value = cmd2.utils.strip_quotes(value)
                             table.add(param_name, settable.val_type(value))
                         except KeyError:
@@ -958,8 +1108,8 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 else:
                     # all the other sections/tables are servers
                     table = tomlkit.table()
-                    for key in dict(iniconfig[section]):
-                        value = iniconfig[section][key]
+                    for key in inisection:
+                        value = inisection[key]
                         # all values here are strings, except for 'verify' which
                         # is a boolen. Let's check for that and convert if necessary
                         if key == "verify":
@@ -980,7 +1130,23 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Override cmd2 builtin show command to be invalid"""
         self.default(cmdline)
 
-    @property
+    def add_settable(self, settable: cmd2.Settable) -> None:
+        """Add a settable parameter, and forget the sorted list of names"""
+        super().add_settable(settable)
+        self._sorted_settables = None
+
+    def remove_settable(self, name: str) -> None:
+        """Remove a settable parameter, and forget the sorted list of names"""
+        super().remove_settable(name)
+        self._sorted_settables = None
+
+    def _sorted_settable_names(self) -> Tuple[str, ...]:
+        """Get the names of all the settable parameters in sorted order"""
+        if self._sorted_settables is None:
+            self._sorted_settables = tuple(sorted(self.settables))
+        return self._sorted_settables
+
+    @_cached_parser
     def settings_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the settings command."""
         parser = argparse.ArgumentParser(
@@ -1000,11 +1166,18 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """display program settings"""
         args = self.parse_args(self.settings_parser, cmdline.argv)
 
-        if args.setting and args.setting not in self.settables:
+        # self.settables builds a new dictionary every time it's accessed
+        settables = self.settables
+        if args.setting and args.setting not in settables:
             self.perror(f"unknown setting: '{args.setting}'")
             self.exit_code = self.EXIT_ERROR
             return
 
+        # we only need tomlkit to render toml, which doesn't happen in most
+        # sessions, so don't import it until we need it
+        # pylint: disable=import-outside-toplevel
+        import tomlkit
+
         # create a table with the desired output, we use this so the
         # comments line up nicely
         otable = rich.table.Table(
@@ -1018,45 +1191,44 @@ class InteractiveTomcatManager(cmd2.Cmd):
         # for the comment which contains the description of the setting
         otable.add_column(no_wrap=True)
 
-        for setting in sorted(self.settables):
-            if (not args.setting) or (setting == args.setting):
-                styled_setting = rich.text.Text(setting, style="tm.setting.name")
-                styled_setting += " "
-                styled_setting += rich.text.Text("=", style="tm.setting.equals")
-                styled_setting += " "
-
-                # create a tomlkit table so we can have tomlkit worry about
-                # how render our python setting values as valid toml
-                ttable = tomlkit.table()
-                ttable.add(setting, getattr(self, setting))
-                # now dump the table and peel off everything after
-                # the first equal sign for the value
-                # this breaks on quoted keys that contain and equals sign
-                # but that shouldn't happen much
-                value = tomlkit.dumps(ttable).split("=", 1)[1].strip()
-
-                typ = type(getattr(self, setting))
-                styled_value = value
-                if typ == bool:
-                    styled_value = rich.text.Text(value, style="tm.setting.bool")
-                elif typ == str:
-                    styled_value = rich.text.Text(value, style="tm.setting.string")
-                elif typ == float:
-                    styled_value = rich.text.Text(value, style="tm.setting.float")
-                # we have no integer settings, so no way to test this, but it's
-                # here for the future
-                # elif typ == int:
-                #    styled_value = rich.text.Text(value, style="tm.setting.int")
-
-                styled_setting += styled_value
-                styled_comment = rich.text.Text(
-                    f"# {self.settables[setting].description}",
-                    style="tm.setting.comment",
-                )
-                otable.add_row(
-                    styled_setting,
-                    styled_comment,
-                )
+        # when they ask for one setting, we already know which one to show
+        if args.setting:
+            setting_names = (args.setting,)
+        else:
+            setting_names = self._sorted_settable_names()
+        for setting in setting_names:
+            styled_setting = rich.text.Text(setting, style="tm.setting.name")
+            styled_setting += " "
+            styled_setting += rich.text.Text("=", style="tm.setting.equals")
+            styled_setting += " "
+
+            # let tomlkit worry about how to render our python setting
+            # values as valid toml
+            pvalue = getattr(self, setting)
+            value = tomlkit.item(pvalue).as_string()
+
+            typ = type(pvalue)
+            styled_value = value
+            if typ == bool:
+                styled_value = rich.text.Text(value, style="tm.setting.bool")
+            elif typ == str:
+                styled_value = rich.text.Text(value, style="tm.setting.string")
+            elif typ == float:
+                styled_value = rich.text.Text(value, style="tm.setting.float")
+            # we have no integer settings, so no way to test this, but it's
+            # here for the future
+            # elif typ == int:
+            #    styled_value = rich.text.Text(value, style="tm.setting.int")
+
+            styled_setting += styled_value
+            styled_comment = rich.text.Text(
+                f"# {settables[setting].description}",
+                style="tm.setting.comment",
+            )
+            otable.add_row(
+                styled_setting,
+                styled_comment,
+            )
 
         self.console.print(otable)
         self.exit_code = self.EXIT_SUCCESS
@@ -1065,7 +1237,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'settings' command"""
         self.show_help_from(self.settings_parser)
 
-    @property
+    @_cached_parser
     def set_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the set command."""
         # we don't actually parse input with this argument parser
@@ -1123,16 +1295,19 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 # rest should be fine
                 tomlstr = args.raw.replace("set ", "", 1)
                 setting_string = f"[settings]\n{tomlstr}"
-                config = tomlkit.loads(setting_string)
-
-                for param_name in config["settings"]:
-                    if param_name in self.settables:
-                        self._change_setting(param_name, config["settings"][param_name])
+                # tomllib gives us native python values, not tomlkit objects
+                config = tomllib.loads(setting_string)
+
+                # self.settables builds a new dictionary every time it's accessed
+                settables = self.settables
+                for param_name, value in config["settings"].items():
+                    if param_name in settables:
+                        self._change_setting(param_name, value)
                         self.exit_code = self.EXIT_SUCCESS
                     else:
                         self.perror(f"unknown setting: '{param_name}'")
                         self.exit_code = self.EXIT_ERROR
-            except tomlkit.exceptions.TOMLKitError:
+            except tomllib.TOMLDecodeError:
                 self.perror(
                     "invalid syntax: use 'help set' to view syntax and examples"
                 )
@@ -1152,7 +1327,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'set' command"""
         self.show_help_from(self.set_parser)
 
-    def _build_theme_parsers(self) -> Dict:
+    def _build_theme_parsers(self) -> Dict[str, argparse.ArgumentParser]:
         """Construct all the argument parsers for the theme command."""
         main_parser = argparse.ArgumentParser(
             prog="theme",
@@ -1254,11 +1429,14 @@ class InteractiveTomcatManager(cmd2.Cmd):
         parsers["dir"] = dir_parser
         return parsers
 
+    def _theme_parsers(self) -> Dict[str, argparse.ArgumentParser]:
+        """Get all the argument parsers for the theme command."""
+        return self.cached_parser("_theme_parsers", self._build_theme_parsers)
+
     @property
     def theme_parser(self) -> argparse.ArgumentParser:
         """Get the main argument parser for the theme command."""
-        parsers = self._build_theme_parsers()
-        return parsers["theme"]
+        return self._theme_parsers()["theme"]
 
     def do_theme(self, cmdline: cmd2.Statement):
         """manage themes"""
@@ -1280,7 +1458,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 timeout=self.timeout,
             )
         if response.status_code == 200:
-            gallery_dir = tomlkit.loads(response.text)
+            gallery_dir = tomllib.loads(response.text)
             for theme_name in gallery_dir:
                 theme = Theme(
                     location=ThemeLocation.GALLERY,
@@ -1303,7 +1481,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
                     rich.text.Text(theme.name, style="tm.theme.name"), theme.description
                 )
             self.console.print("Gallery Themes", style="tm.theme.category")
-            self.console.print("─" * 72, style="tm.theme.border")
+            self.console.print(_HELP_RULE, style="tm.theme.border")
             self.console.print(gallery_table)
 
         # built-in themes
@@ -1322,14 +1500,14 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 # go read the theme in to get the description
                 tdesc = ""
                 try:
-                    with path.open("r", encoding="utf-8") as theme_fobj:
-                        theme_def = tomlkit.load(theme_fobj)
+                    with path.open("rb") as theme_fobj:
+                        theme_def = tomllib.load(theme_fobj)
                         tdesc = theme_def["description"]
                 except OSError:
                     # this really shouldn't happen so much for the built-in themes
                     # but if it doesn, don't show it in the list
                     continue
-                except tomlkit.exceptions.TOMLKitError:
+                except (tomllib.TOMLDecodeError, KeyError):
                     # this really shouldnt' happen either, because we should ship
                     # valid built-in themes. But if it does, skipt it because
                     # the user can't load it and they can't edit it
@@ -1346,14 +1524,14 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 if path.suffix == ".toml":
                     tdesc = ""
                     try:
-                        with path.open("r", encoding="utf-8") as theme_fobj:
-                            theme_def = tomlkit.load(theme_fobj)
+                        with path.open("rb") as theme_fobj:
+                            theme_def = tomllib.load(theme_fobj)
                             tdesc = theme_def["description"]
                     except OSError:
                         # file couldn't be opened, or an error occured reading
                         # it. best not show this one in the list, so we skip over it
                         continue
-                    except tomlkit.exceptions.TOMLKitError:
+                    except (tomllib.TOMLDecodeError, KeyError):
                         # badly formed toml, or no description field
                         # but the file exists, so show it in the list but
                         # with no description
@@ -1379,7 +1557,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 )
         self.console.print("")
         self.console.print("User Themes", style="tm.theme.category")
-        self.console.print("─" * 72, style="tm.theme.border")
+        self.console.print(_HELP_RULE, style="tm.theme.border")
         if user_themes:
             self.console.print(user_table)
         else:
@@ -1486,20 +1664,13 @@ class InteractiveTomcatManager(cmd2.Cmd):
             self.exit_code = self.EXIT_ERROR
             return
 
-        # go edit the file
-        cmd = f'"{self.editor}" "{theme_file}"'
-        self.pfeedback(f"executing {cmd}")
-        os.system(cmd)
-
-        # reapply the theme if necessary
-        if self.theme == name:
-            self.pfeedback(f"reloading theme: '{self.theme}'")
-            if not self._apply_theme(name):
-                self.exit_code = self.EXIT_ERROR
-                return
-
-        self.exit_code = self.EXIT_SUCCESS
-        return
+        # go edit the file, and if that worked, reapply the theme if necessary
+        if self._run_editor(theme_file):
+            self.exit_code = self.EXIT_SUCCESS
+            if self.theme == name:
+                self.pfeedback(f"reloading theme: '{self.theme}'")
+                if not self._apply_theme(name):
+                    self.exit_code = self.EXIT_ERROR
 
     def theme_create(self, args: argparse.Namespace):
         """create a user theme file from a template"""
@@ -1553,6 +1724,28 @@ class InteractiveTomcatManager(cmd2.Cmd):
     # other methods and properties related to configuration and settings
     #
     ###
+    @property
+    def appdirs(self):
+        """The appdirs.AppDirs object used to find the user configuration directory"""
+        return self._appdirs
+
+    @appdirs.setter
+    def appdirs(self, value):
+        """Set the appdirs.AppDirs object, and forget the directory it resolved to"""
+        self._appdirs = value
+        self._user_config_dir = None
+
+    def _resolved_user_config_dir(self) -> pathlib.Path:
+        """
+        The fully resolved user configuration directory.
+
+        Resolving the path has to look at every directory in it, and we use
+        it for several files, so we only do it once.
+        """
+        if self._user_config_dir is None:
+            self._user_config_dir = pathlib.Path(self.appdirs.user_config_dir).resolve()
+        return self._user_config_dir
+
     @property
     def config_file(self) -> pathlib.Path:
         """
@@ -1563,7 +1756,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """
         if self.appdirs:
             filename = self.app_name + ".toml"
-            return pathlib.Path(self.appdirs.user_config_dir).resolve() / filename
+            return self._resolved_user_config_dir() / filename
         return None
 
     @property
@@ -1581,7 +1774,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """
         if self.appdirs:
             filename = self.app_name + ".ini"
-            return pathlib.Path(self.appdirs.user_config_dir).resolve() / filename
+            return self._resolved_user_config_dir() / filename
         return None
 
     @property
@@ -1594,7 +1787,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
                  defined.
         """
         if self.appdirs:
-            return pathlib.Path(self.appdirs.user_config_dir).resolve() / "history.txt"
+            return self._resolved_user_config_dir() / "history.txt"
         return None
 
     @property
@@ -1611,7 +1804,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
                  self.appdirs has not been defined.
         """
         if self.appdirs:
-            return pathlib.Path(self.appdirs.user_config_dir).resolve() / "themes"
+            return self._resolved_user_config_dir() / "themes"
         return None
 
     def ensure_user_theme_dir(self):
@@ -1624,12 +1817,15 @@ class InteractiveTomcatManager(cmd2.Cmd):
 
     def load_config(self):
         """Open and parse the user config file and set self.config."""
-        config = tomlkit.loads("")
+        # we only read the config file here, so use tomllib, which is much
+        # faster than tomlkit because it doesn't preserve formatting
+        config: Dict[str, Any] = {}
         if self.config_file is not None:
             try:
-                with open(self.config_file, "r", encoding="utf-8") as fobj:
-                    config = tomlkit.loads(fobj.read())
-            except tomlkit.exceptions.TOMLKitError as err:
+                # tomllib wants a binary file, which it reads all at once
+                with open(self.config_file, "rb") as fobj:
+                    config = tomllib.load(fobj)
+            except tomllib.TOMLDecodeError as err:
                 self.perror(f"error loading configuration file: {err}")
             except FileNotFoundError:
                 pass
@@ -1642,9 +1838,9 @@ class InteractiveTomcatManager(cmd2.Cmd):
         first_error = True
         try:
             settings = config["settings"]
-            for key in settings:
+            for key, value in settings.items():
                 try:
-                    self._change_setting(key, settings[key])
+                    self._change_setting(key, value)
                 except ValueError as err:
                     # could be the setting name, or the setting value
                     if first_error:
@@ -1653,7 +1849,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
                         )
                         first_error = False
                     self.perror(err)
-        except tomlkit.exceptions.NonExistentKey:
+        except KeyError:
             # we don't have a settings section, so there are no settings to load
             pass
         self.config = config
@@ -1683,15 +1879,18 @@ class InteractiveTomcatManager(cmd2.Cmd):
     @classmethod
     def convert_to_boolean(cls, value: Any):
         """Return a boolean value translating from other types if necessary."""
-        if isinstance(value, bool) is True:
+        if isinstance(value, bool):
             return value
 
-        if str(value).lower() not in cls.BOOLEAN_VALUES:
+        try:
+            return cls.BOOLEAN_VALUES[str(value).lower()]
+        except KeyError:
             if value is None or value == "":
-                raise ValueError("invalid syntax: must be true-ish or false-ish")
+                raise ValueError(
+                    "invalid syntax: must be true-ish or false-ish"
+                ) from None
             # we can't figure out what it is
-            raise ValueError(f"invalid syntax: not a boolean: '{value}'")
-        return cls.BOOLEAN_VALUES[value.lower()]
+            raise ValueError(f"invalid syntax: not a boolean: '{value}'") from None
 
     @staticmethod
     def _pythonize(value: str):
@@ -1706,18 +1905,17 @@ class InteractiveTomcatManager(cmd2.Cmd):
             pvalue = value
         """
         single_quote = "'"
-        double_quote = '"'
+        has_single = single_quote in value
+        has_double = '"' in value
         pvalue = value
-        if (single_quote in value) and (double_quote in value):
+        if has_single and has_double:
             # use sq as the outer quote, which means we have to
             # backslash all the other sq in the string
             value = value.replace(single_quote, "\\" + single_quote)
             pvalue = f"'{value}'"
-        elif single_quote in value:
+        elif has_single:
             pvalue = f'"{value}"'
-        elif double_quote in value:
-            pvalue = f"'{value}'"
-        elif " " in value:
+        elif has_double or " " in value:
             pvalue = f"'{value}'"
         return pvalue
 
@@ -1726,7 +1924,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
     # Connecting to Tomcat
     #
     ###
-    @property
+    @_cached_parser
     def connect_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the connect command."""
 
@@ -1820,21 +2018,15 @@ class InteractiveTomcatManager(cmd2.Cmd):
             self.exit_code = self.EXIT_USAGE
             return
 
-        if server in self.config.keys():
-            if "url" in self.config[server].keys():
-                url = self.config[server]["url"]
-            if "user" in self.config[server].keys():
-                user = self.config[server]["user"]
-            if "password" in self.config[server].keys():
-                password = self.config[server]["password"]
-            if "cert" in self.config[server].keys():
-                cert = self.config[server]["cert"]
-            if "key" in self.config[server].keys():
-                key = self.config[server]["key"]
-            if "cacert" in self.config[server].keys():
-                cacert = self.config[server]["cacert"]
-            if "verify" in self.config[server].keys():
-                verify = self.config[server]["verify"]
+        srv = self.config.get(server)
+        if srv is not None:
+            url = srv.get("url", url)
+            user = srv.get("user", user)
+            password = srv.get("password", password)
+            cert = srv.get("cert", cert)
+            key = srv.get("key", key)
+            cacert = srv.get("cacert", cacert)
+            verify = srv.get("verify", verify)
         else:
             # This is an ugly hack required to get argparse to show the help properly.
             # the argparser has both a config_name and a url positional argument.
@@ -1898,21 +2090,20 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 else:
                     # need to see whether we got an http error or whether
                     # tomcat wasn't at the url
-                    if r.response.status_code == requests.codes.ok:
+                    status_code = r.response.status_code
+                    if status_code == requests.codes.ok:
                         # there was some problem with the request, but we
                         # got http 200 OK. That means there was no tomcat
                         # at the url
                         self.perror(f"tomcat manager not found at {url}")
-                    elif r.response.status_code == requests.codes.not_found:
+                    elif status_code == requests.codes.not_found:
                         # we connected, but the url was bad. No tomcat there
                         self.perror(f"tomcat manager not found at {url}")
                     else:
-                        self.perror(
-                            (
-                                f"http error: {r.response.status_code}"
-                                f" {http.client.responses[r.response.status_code]}"
-                            )
-                        )
+                        # servers and proxies can send codes that aren't
+                        # in the standard list
+                        reason = http.client.responses.get(status_code, "Unknown")
+                        self.perror(f"http error: {status_code} {reason}")
                     self.exit_code = self.EXIT_ERROR
         except requests.exceptions.ConnectionError:
             if self.debug:
@@ -1931,7 +2122,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'connect' command."""
         self.show_help_from(self.connect_parser)
 
-    @property
+    @_cached_parser
     def which_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the which command."""
         parser = argparse.ArgumentParser(
@@ -1951,7 +2142,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'which' command"""
         self.show_help_from(self.which_parser)
 
-    @property
+    @_cached_parser
     def disconnect_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the disconnect command."""
         parser = argparse.ArgumentParser(
@@ -2027,16 +2218,23 @@ class InteractiveTomcatManager(cmd2.Cmd):
             update=update,
         )
 
+    def _get_deploy_parsers(self, name: str) -> Tuple:
+        """Get the parser and subparsers for deploy or redeploy"""
+        return self.cached_parser(
+            f"{name}_parsers",
+            lambda: _deploy_parser(
+                name,
+                self.do_deploy.__doc__,
+                self.deploy_local,
+                self.deploy_server,
+                self.deploy_context,
+            ),
+        )
+
     @property
     def deploy_parser(self) -> argparse.ArgumentParser:
-        """Build an argument parser for the deploy command."""
-        (parser, _, _, _) = _deploy_parser(
-            "deploy",
-            self.do_deploy.__doc__,
-            self.deploy_local,
-            self.deploy_server,
-            self.deploy_context,
-        )
+        """Get the argument parser for the deploy command."""
+        (parser, _, _, _) = self._get_deploy_parsers("deploy")
         return parser
 
     def do_deploy(self, cmdline: cmd2.Statement):
@@ -2059,14 +2257,8 @@ class InteractiveTomcatManager(cmd2.Cmd):
 
     @property
     def redeploy_parser(self) -> argparse.ArgumentParser:
-        """Build an argument parser for the redeploy command."""
-        (parser, _, _, _) = _deploy_parser(
-            "redeploy",
-            self.do_deploy.__doc__,
-            self.deploy_local,
-            self.deploy_server,
-            self.deploy_context,
-        )
+        """Get the argument parser for the redeploy command."""
+        (parser, _, _, _) = self._get_deploy_parsers("redeploy")
         return parser
 
     def do_redeploy(self, cmdline: cmd2.Statement):
@@ -2166,7 +2358,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'restart' command"""
         self.show_help_from(self.restart_parser)
 
-    @property
+    @_cached_parser
     def sessions_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the sessions command."""
         parser = argparse.ArgumentParser(
@@ -2201,7 +2393,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'sessions' command."""
         self.show_help_from(self.sessions_parser)
 
-    @property
+    @_cached_parser
     def expire_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the expire command."""
         parser = argparse.ArgumentParser(
@@ -2241,7 +2433,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'expire' command"""
         self.show_help_from(self.expire_parser)
 
-    @property
+    @_cached_parser
     def list_parser(self) -> argparse.ArgumentParser:
         """Build the argument parser for the list command"""
         parser = argparse.ArgumentParser(
@@ -2280,8 +2472,8 @@ class InteractiveTomcatManager(cmd2.Cmd):
             apps = self._list_process_apps(response.apps, args)
             self.exit_code = self.EXIT_SUCCESS
             if args.raw:
-                for app in apps:
-                    self.poutput(app)
+                if apps:
+                    self.poutput("\n".join(map(str, apps)))
             else:
                 table = rich.table.Table(
                     box=rich.box.HORIZONTALS,
@@ -2294,11 +2486,16 @@ class InteractiveTomcatManager(cmd2.Cmd):
                 table.add_column("State")
                 table.add_column("Sessions", justify="right")
                 table.add_column("Directory")
+                # there are only a handful of states, so style each one once
+                # and share the Text across rows
+                state_texts = {
+                    state: rich.text.Text(state.value, style=f"tm.app.{state.value}")
+                    for state in tm.models.ApplicationState
+                }
                 for app in apps:
-                    state_style = f"tm.app.{app.state.value}"
                     table.add_row(
                         app.path,
-                        rich.text.Text(app.state.value, style=state_style),
+                        state_texts[app.state],
                         rich.text.Text(str(app.sessions), style="tm.app.sessions"),
                         app.directory_and_version,
                     )
@@ -2317,23 +2514,16 @@ class InteractiveTomcatManager(cmd2.Cmd):
 
         :return: a list of `TomcatApplication` objects
         """
-        rtn = []
         # select the apps that should be included
         if args.state:
             filter_state = tm.models.ApplicationState.parse(args.state)
-            rtn = filter(lambda app: app.state == filter_state, apps)
-        else:
-            rtn = apps
-        # now sort them
+            apps = [app for app in apps if app.state is filter_state]
+        # now sort them, sorted() only calls the key function once per app
         if args.by == "path":
-            rtn = sorted(
-                rtn, key=tm.models.TomcatApplication.sort_by_path_by_version_by_state
-            )
+            key = tm.models.TomcatApplication.sort_by_path_by_version_by_state
         else:
-            rtn = sorted(
-                rtn, key=tm.models.TomcatApplication.sort_by_state_by_path_by_version
-            )
-        return rtn
+            key = tm.models.TomcatApplication.sort_by_state_by_path_by_version
+        return sorted(apps, key=key)
 
     ###
     #
@@ -2341,7 +2531,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
     # information from the server.
     #
     ###
-    @property
+    @_cached_parser
     def serverinfo_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the serverinfo command."""
         return argparse.ArgumentParser(
@@ -2362,7 +2552,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'serverinfo' command"""
         self.show_help_from(self.serverinfo_parser)
 
-    @property
+    @_cached_parser
     def status_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the status command."""
         return argparse.ArgumentParser(
@@ -2376,6 +2566,11 @@ class InteractiveTomcatManager(cmd2.Cmd):
         self.parse_args(self.status_parser, cmdline.argv)
         self.raise_if_not_connected()
         r = self.docmd("querying server", self.tomcat.status_xml)
+        # only this command needs an xml parser, so don't import
+        # it until we need it
+        # pylint: disable=import-outside-toplevel
+        import xml.dom.minidom
+
         root = xml.dom.minidom.parseString(r.status_xml)
         self.console.print(root.toprettyxml(indent="   ").strip())
 
@@ -2383,7 +2578,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'status' command"""
         self.show_help_from(self.status_parser)
 
-    @property
+    @_cached_parser
     def vminfo_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the vminfo command."""
         return argparse.ArgumentParser(
@@ -2403,7 +2598,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'vminfo' command"""
         self.show_help_from(self.vminfo_parser)
 
-    @property
+    @_cached_parser
     def sslconnectorciphers_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the sslconnectorciphers command."""
         return argparse.ArgumentParser(
@@ -2423,7 +2618,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'sslconnectorciphers' command"""
         self.show_help_from(self.sslconnectorciphers_parser)
 
-    @property
+    @_cached_parser
     def sslconnectorcerts_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the sslconnectorcerts command."""
         return argparse.ArgumentParser(
@@ -2443,7 +2638,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'sslconnectorcerts' command"""
         self.show_help_from(self.sslconnectorcerts_parser)
 
-    @property
+    @_cached_parser
     def sslconnectortrustedcerts_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the sslconnectortrustedcerts command."""
         return argparse.ArgumentParser(
@@ -2463,7 +2658,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'sslconnectortrustedcerts' command"""
         self.show_help_from(self.sslconnectortrustedcerts_parser)
 
-    @property
+    @_cached_parser
     def sslreload_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the sslreload command."""
         parser = argparse.ArgumentParser(
@@ -2488,7 +2683,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'sslreload' command"""
         self.show_help_from(self.sslreload_parser)
 
-    @property
+    @_cached_parser
     def threaddump_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the threaddump command"""
         return argparse.ArgumentParser(
@@ -2508,7 +2703,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'threaddump' command"""
         self.show_help_from(self.threaddump_parser)
 
-    @property
+    @_cached_parser
     def resources_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the resources command"""
         parser = argparse.ArgumentParser(
@@ -2529,8 +2724,12 @@ class InteractiveTomcatManager(cmd2.Cmd):
         self.raise_if_not_connected()
         r = self.docmd("querying server", self.tomcat.resources, args.class_name)
         if r.resources:
-            for resource, classname in iter(sorted(r.resources.items())):
-                self.poutput(f"{resource}: {classname}")
+            self.poutput(
+                "\n".join(
+                    f"{resource}: {classname}"
+                    for resource, classname in sorted(r.resources.items())
+                )
+            )
         else:
             self.exit_code = self.EXIT_ERROR
 
@@ -2538,7 +2737,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'resources' command"""
         self.show_help_from(self.resources_parser)
 
-    @property
+    @_cached_parser
     def findleakers_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the findleakers command."""
         return argparse.ArgumentParser(
@@ -2554,8 +2753,8 @@ class InteractiveTomcatManager(cmd2.Cmd):
         self.parse_args(self.findleakers_parser, cmdline.argv)
         self.raise_if_not_connected()
         r = self.docmd("finding memory leaks", self.tomcat.find_leakers)
-        for leaker in r.leakers:
-            self.poutput(leaker)
+        if r.leakers:
+            self.poutput("\n".join(r.leakers))
 
     def help_findleakers(self):
         """Show help for the 'findleakers' command"""
@@ -2579,7 +2778,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """exit on the end-of-file character"""
         return self.do_exit(cmdline)
 
-    @property
+    @_cached_parser
     def version_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the version command."""
         parser = argparse.ArgumentParser(
@@ -2598,19 +2797,18 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'version' command"""
         self.show_help_from(self.version_parser)
 
-    @property
+    @_cached_parser
     def exit_code_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the exit_code command."""
-        exit_code_epilog = []
-        exit_code_epilog.append("The codes have the following meanings:")
-        for number, name in self.EXIT_CODES.items():
-            exit_code_epilog.append(f"    {number:3}  {name}")
+        exit_code_epilog = "The codes have the following meanings:\n" + "\n".join(
+            f"    {number:3}  {name}" for number, name in self.EXIT_CODES.items()
+        )
 
         return argparse.ArgumentParser(
             prog="exit_code",
             formatter_class=RawDescriptionRichHelpFormatter,
             description=self.do_exit_code.__doc__,
-            epilog="\n".join(exit_code_epilog),
+            epilog=exit_code_epilog,
         )
 
     def do_exit_code(self, _):
@@ -2626,7 +2824,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
         """Show help for the 'exit_code' command"""
         self.show_help_from(self.exit_code_parser)
 
-    @property
+    @_cached_parser
     def license_parser(self) -> argparse.ArgumentParser:
         """Build an argument parser for the license command."""
         parser = argparse.ArgumentParser(
@@ -2639,30 +2837,7 @@ class InteractiveTomcatManager(cmd2.Cmd):
     def do_license(self, cmdline: cmd2.Statement):
         """show the software license for this program"""
         self.parse_args(self.license_parser, cmdline.argv)
-        mitlicense = textwrap.dedent(
-            """\
-            Copyright 2007 Jared Crapo
-
-            Permission is hereby granted, free of charge, to any person obtaining a
-            copy of this software and associated documentation files (the "Software"),
-            to deal in the Software without restriction, including without limitation
-            the rights to use, copy, modify, merge, publish, distribute, sublicense,
-            and/or sell copies of the Software, and to permit persons to whom the
-            Software is furnished to do so, subject to the following conditions:
-
-            The above copyright notice and this permission notice shall be included in
-            all copies or substantial portions of the Software.
-
-            THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-            IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-            FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-            AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-            LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-            FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
-            DEALINGS IN THE SOFTWARE.
-            """
-        )
-        self.poutput(mitlicense)
+        self.poutput(_MIT_LICENSE)
 
     def help_license(self):
         """Show help for the 'license' command"""
@@ -2710,38 +2885,30 @@ class EvaluatingConfigParser(configparser.ConfigParser):
     def get(self, section, option, **kwargs):
         val = super().get(section, option, **kwargs)
         if "'" in val or '"' in val:
+            # most values are double quoted strings without escapes, which
+            # json and python parse the same way, and json is much faster
+            if val[0] == '"' and "\\" not in val:
+                try:
+                    return json.loads(val)
+                except ValueError:
+                    pass
             try:
                 val = ast.literal_eval(val)
-            except ValueError:  # pragma: nocover
+            except (ValueError, SyntaxError):
+                # not a python literal, e.g. an unbalanced quote, so leave
+                # it as a string
                 pass
         return val
 
 
-def _to_bool(val: Any) -> bool:
-    """Converts anything to a boolean based on its value.
-
-    :param val: value being converted
-    :return: boolean value expressed in the passed in value
-    :raises: ValueError if the string can not be cast to a boolen
-
-    This has to be able to accommodate TOML-style bools, as well as
-    ini-style bools. That's why we lowercase the input before testing.
+@functools.lru_cache(maxsize=None)
+def _path_version_parser(cmdname: str, helpmsg: str) -> argparse.ArgumentParser:
     """
-    if isinstance(val, str):
-        if val.lower() == "true":
-            return True
-        if val.lower() == "false":
-            return False
-        raise ValueError("syntax error: must be 'true' or 'false'")
-
-    if isinstance(val, bool):
-        return val
+    Construct an argparser using the given parameters
 
-    return bool(val)
-
-
-def _path_version_parser(cmdname: str, helpmsg: str) -> argparse.ArgumentParser:
-    """Construct an argparser using the given parameters"""
+    The parser only depends on the parameters, so we build it once and
+    hand back the same one for subsequent calls.
+    """
     parser = argparse.ArgumentParser(
         prog=cmdname,
         description=helpmsg,
@@ -2762,6 +2929,28 @@ def _path_version_parser(cmdname: str, helpmsg: str) -> argparse.ArgumentParser:
     return parser
 
 
+_JAVA_PATH_HELP = (
+    "the java-style path (use slashes not backslashes) to the"
+    " war file on the server file system; don't include 'file:'"
+    " at the beginning"
+)
+
+
+def _add_java_path_positional(
+    parser: argparse.ArgumentParser,
+    name: str,
+    *,
+    optional: bool = False,
+    help_suffix: str = "",
+):
+    """Add a positional argument for a java-style path on the server"""
+    parser.add_argument(
+        name,
+        nargs="?" if optional else None,
+        help=_JAVA_PATH_HELP + help_suffix,
+    )
+
+
 def _deploy_parser(
     name: str,
     desc: str,
@@ -2818,14 +3007,7 @@ def _deploy_parser(
     deploy_server_parser.add_argument(
         "-v", "--version", help="version string to associate with this deployment"
     )
-    deploy_server_parser.add_argument(
-        "warfile",
-        help=(
-            "the java-style path (use slashes not backslashes) to the"
-            " war file on the server file system; don't include 'file:'"
-            " at the beginning"
-        ),
-    )
+    _add_java_path_positional(deploy_server_parser, "warfile")
     deploy_server_parser.add_argument(
         "path",
         help=(
@@ -2846,23 +3028,12 @@ def _deploy_parser(
         "--version",
         help="version string to associate with this deployment",
     )
-    deploy_context_parser.add_argument(
-        "contextfile",
-        help=(
-            "the java-style path (use slashes not backslashes) to the"
-            " war file on the server file system; don't include 'file:'"
-            " at the beginning"
-        ),
-    )
-    deploy_context_parser.add_argument(
+    _add_java_path_positional(deploy_context_parser, "contextfile")
+    _add_java_path_positional(
+        deploy_context_parser,
         "warfile",
-        nargs="?",
-        help=(
-            "the java-style path (use slashes not backslashes) to the"
-            " war file on the server file system; don't include 'file:'"
-            " at the beginning; overrides 'docBase' specified in the"
-            " 'contextfile'"
-        ),
+        optional=True,
+        help_suffix="; overrides 'docBase' specified in the 'contextfile'",
     )
     deploy_context_parser.add_argument(
         "path",
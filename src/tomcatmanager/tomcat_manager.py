@@ -46,7 +46,9 @@ from .models import (
 )
 
 
-# pylint: disable=too-many-public-methods
+# the instance attributes are the connection state: the server, the
+# credentials, the tomcat version, and the requests session they are used with
+# pylint: disable=too-many-public-methods, too-many-instance-attributes
 class TomcatManager:
     """
     A class for interacting with the Tomcat Manager web application.
@@ -76,6 +78,19 @@ class TomcatManager:
        except Exception as err:
            # handle exception
            print("not connected")
+
+    All the requests to the server go through one ``requests.Session``, so the
+    network connection is reused from one call to the next. Sessions are not
+    guaranteed to be thread safe, so don't share one instance of this class
+    between threads; create one per thread instead. Call :meth:`.close`, or use
+    the instance as a context manager, to release the connection when you are
+    done:
+
+    .. code-block:: python
+
+       with tm.TomcatManager() as tomcat:
+           r = tomcat.connect(url, user, password)
+           ...
     """
 
     # pylint: disable=invalid-name, too-few-public-methods, inconsistent-return-statements
@@ -177,6 +192,11 @@ class TomcatManager:
         # this is set by connect()
         self._tomcat_major_minor = None
 
+        # all our requests go through one session, so that the connection
+        # to the server, including any SSL/TLS handshake, is kept open and
+        # reused from one command to the next
+        self._session = requests.Session()
+
         self.timeout = 10.0
         """Seconds to wait before giving up on network operations. Can be a
         ``float`` or an ``int``. Default is ``10``. I surely don't want to wait forever,
@@ -529,6 +549,22 @@ class TomcatManager:
         self._clear_server_attrs()
         return True
 
+    def close(self):
+        """Disconnect from the server and close any network connections kept
+        open for reuse.
+
+        Called automatically when the instance is used as a context manager.
+
+        .. versionadded:: 7.1.0
+        """
+        self.disconnect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     ###
     # managing applications
     ###
@@ -568,10 +604,10 @@ class TomcatManager:
         base = self._url or ""
         url = base + "/text/deploy"
         r = TomcatManagerResponse()
-        # have to have the requests.put call in two places so we can
+        # have to have the put call in two places so we can
         # properly close the file if we open it
         if self._is_stream(warfile):
-            r.response = requests.put(
+            r.response = self._session.put(
                 url,
                 auth=(self._user, self._password),
                 params=params,
@@ -580,7 +616,7 @@ class TomcatManager:
             )
         else:
             with open(warfile, "rb") as warobj:
-                r.response = requests.put(
+                r.response = self._session.put(
                     url,
                     auth=(self._user, self._password),
                     params=params,
@@ -911,7 +947,7 @@ class TomcatManager:
         base = self._url or ""
         url = base + "/status/all"
         r = TomcatManagerResponse()
-        r.response = requests.get(
+        r.response = self._session.get(
             url,
             auth=(self._user, self._password),
             params={"XML": "true"},
@@ -1131,6 +1167,9 @@ class TomcatManager:
         self._cert = None
         self._verify = None
         self._tomcat_major_minor = None
+        # don't keep connections or cookies from the previous server
+        self._session.close()
+        self._session.cookies.clear()
 
     def _get(self, cmd: str, payload: dict = None) -> TomcatManagerResponse:
         """
@@ -1153,7 +1192,7 @@ class TomcatManager:
             authinfo = (self._user, self._password)
 
         r = TomcatManagerResponse()
-        r.response = requests.get(
+        r.response = self._session.get(
             url,
             auth=authinfo,
             params=payload,
@@ -34,13 +34,20 @@ except AttributeError:  # pragma: nocover
     # pylint: disable=import-error
     import importlib_resources  # type: ignore
 
+try:
+    import tomllib
+except ImportError:  # pragma: nocover
+    # pylint: disable=import-error
+    import tomli as tomllib  # type: ignore
+
 import pathlib
 import textwrap
 from unittest import mock
 import uuid
 
+import cmd2
 import pytest
-import tomlkit
+import rich.progress
 
 import tomcatmanager as tm
 
@@ -232,6 +239,25 @@ def test_help_deploy_context(itm_nc, capsys):
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
 
 
+def test_deploy_parsers_built_on_first_use(itm_nc):
+    assert "deploy_parsers" not in itm_nc._parsers
+    assert "redeploy_parsers" not in itm_nc._parsers
+    parser = itm_nc.deploy_parser
+    assert itm_nc._parsers["deploy_parsers"][0] is parser
+    assert itm_nc.deploy_parser is parser
+    assert itm_nc.redeploy_parser is itm_nc._parsers["redeploy_parsers"][0]
+    assert itm_nc.redeploy_parser.prog == "redeploy"
+
+
+def test_cached_parsers_built_on_first_use(itm_nc):
+    # cmd2 inspects all our properties during __init__(), make sure
+    # that didn't build the parsers
+    assert "config_parser" not in itm_nc._parsers
+    parser = itm_nc.config_parser
+    assert itm_nc._parsers["config_parser"] is parser
+    assert itm_nc.config_parser is parser
+
+
 THEME_USAGE_COMMANDS = [
     "help theme",
     "help theme invalid",
@@ -315,6 +341,16 @@ def test_help(itm_nc, capsys):
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
 
 
+def test_help_twice(itm_nc, capsys):
+    # the help tables are cached, make sure they render the same every time
+    itm_nc.onecmd_plus_hooks("help")
+    out1, _ = capsys.readouterr()
+    itm_nc.onecmd_plus_hooks("help")
+    out2, _ = capsys.readouterr()
+    assert out1 == out2
+    assert itm_nc._help_sections() is itm_nc._help_sections()
+
+
 def test_help_invalid(itm_nc, capsys):
     cmdline = "help invalidcommand"
     itm_nc.onecmd_plus_hooks(cmdline)
@@ -357,6 +393,8 @@ BOOLEANS = [
     ("FALSE", False),
     (True, True),
     (False, False),
+    (1, True),
+    (0, False),
 ]
 
 
@@ -399,6 +437,18 @@ def test_appdirs():
     assert itm.appdirs
 
 
+def test_appdirs_change(tmp_path, mocker):
+    itm = tm.InteractiveTomcatManager()
+    assert itm.config_file
+    # the resolved directory is cached, make sure it gets
+    # recomputed when appdirs changes
+    new_appdirs = mocker.Mock()
+    new_appdirs.user_config_dir = str(tmp_path)
+    itm.appdirs = new_appdirs
+    assert itm.config_file == tmp_path.resolve() / "tomcat-manager.toml"
+    assert itm.history_file == tmp_path.resolve() / "history.txt"
+
+
 def test_config_file_property():
     itm = tm.InteractiveTomcatManager()
     # don't care where it is, just care that there is one
@@ -428,9 +478,10 @@ def test_history_file_property():
 
 def test_config_edit(itm_nc, mocker):
     itm_nc.editor = "fooedit"
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
     itm_nc.onecmd_plus_hooks("config edit")
-    assert mock_os_system.call_count == 1
+    assert mock_run.call_count == 1
+    assert mock_run.call_args.args[0] == ["fooedit", str(itm_nc.config_file)]
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
 
 
@@ -443,6 +494,19 @@ def test_config_edit_no_editor(itm_nc, capsys):
     assert err.startswith("no editor: ")
 
 
+def test_config_edit_missing_editor(itm_nc, mocker, capsys):
+    # an editor which doesn't exist, so we really try to run it
+    itm_nc.editor = "tomcat-manager-bogus-editor"
+    load_mock = mocker.patch("tomcatmanager.InteractiveTomcatManager.load_config")
+    itm_nc.onecmd_plus_hooks("config edit")
+    out, err = capsys.readouterr()
+    assert itm_nc.exit_code == itm_nc.EXIT_ERROR
+    assert not out
+    assert "could not run editor 'tomcat-manager-bogus-editor'" in err
+    # don't reload the configuration if we never edited it
+    assert load_mock.call_count == 0
+
+
 def test_config_edit_sets_defaults(itm_nc, tmp_path, mocker):
     fname = pathlib.Path(tmp_path / "someconfig.toml")
     config_file = mocker.patch(
@@ -454,10 +518,10 @@ def test_config_edit_sets_defaults(itm_nc, tmp_path, mocker):
     # we need an editor set
     itm_nc.editor = "fooedit"
     # but we prevent the editor from executing
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
 
     itm_nc.onecmd_plus_hooks("config edit")
-    assert mock_os_system.call_count == 1
+    assert mock_run.call_count == 1
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
     assert itm_nc.prompt == "tomcat-manager> "
 
@@ -471,11 +535,11 @@ def test_config_edit_no_configfile(itm_nc, mocker, capsys):
     # we need an editor set
     itm_nc.editor = "fooedit"
     # but we prevent the editor from executing
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
 
     itm_nc.onecmd_plus_hooks("config edit")
     _, err = capsys.readouterr()
-    assert mock_os_system.call_count == 0
+    assert mock_run.call_count == 0
     assert itm_nc.exit_code == itm_nc.EXIT_ERROR
     assert "could not figure out where configuration" in err
 
@@ -596,6 +660,24 @@ verify = false
         assert test_tomlconfig == tomlconfig
 
 
+EVALUATED_VALUES = [
+    ("https://www.example.com", "https://www.example.com"),
+    ('"tm> "', "tm> "),
+    ("'tm> '", "tm> "),
+    ('"C:\\\\temp"', "C:\\temp"),
+    ('"one" "two"', "onetwo"),
+    ("it's", "it's"),
+    ("'one' two", "'one' two"),
+]
+
+
+@pytest.mark.parametrize("value, expected", EVALUATED_VALUES)
+def test_evaluating_config_parser(value, expected):
+    parser = tm.interactive_tomcat_manager.EvaluatingConfigParser()
+    parser.read_string(f"[settings]\nvalue = {value}\n")
+    assert parser.get("settings", "value") == expected
+
+
 def test_config_convert_invalid_setting(itm_nc, tmp_path, mocker, capsys):
     iniconfig = """#
 [settings]
@@ -781,6 +863,41 @@ def test_settings_noargs(itm_nc, capsys):
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
 
 
+def test_parse_args_noargs_cached(itm_nc):
+    parser = itm_nc.settings_parser
+    args1 = itm_nc.parse_args(parser, ["settings"])
+    assert parser in itm_nc._noargs
+    args2 = itm_nc.parse_args(parser, ["settings"])
+    assert args1 == args2
+    # make sure we get a copy, so commands can't change the cached result
+    assert args1 is not args2
+    assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
+
+
+def test_parse_args_noargs_error_not_cached(itm_nc):
+    # config requires an argument, so parsing no arguments is an error
+    parser = itm_nc.config_parser
+    with pytest.raises(cmd2.Cmd2ArgparseError):
+        itm_nc.parse_args(parser, ["config"])
+    assert parser not in itm_nc._noargs
+    assert itm_nc.exit_code == itm_nc.EXIT_USAGE
+
+
+def test_settings_after_add_and_remove(itm_nc, capsys):
+    itm_nc.onecmd_plus_hooks("settings")
+    capsys.readouterr()
+    # the sorted list of settings is cached, make sure it notices changes
+    itm_nc.aaa = "new"
+    itm_nc.add_settable(cmd2.Settable("aaa", str, "a new setting", itm_nc))
+    itm_nc.onecmd_plus_hooks("settings")
+    out, _ = capsys.readouterr()
+    assert out.splitlines()[0].split("=")[0].strip() == "aaa"
+    itm_nc.remove_settable("aaa")
+    itm_nc.onecmd_plus_hooks("settings")
+    out, _ = capsys.readouterr()
+    assert out.splitlines()[0].split("=")[0].strip() == "debug"
+
+
 def test_settings_valid_setting(itm_nc, capsys):
     itm_nc.onecmd_plus_hooks("settings prompt")
     out, _ = capsys.readouterr()
@@ -993,6 +1110,26 @@ def test_status_animation(itm_nc):
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
 
 
+def test_status_animation_not_terminal(itm_nc, capsys):
+    itm_nc.quiet = False
+    # capsys means we aren't writing to a terminal, so there should be
+    # no live display, just the message
+    with itm_nc._progressfactory("working") as progress:
+        assert progress is None
+    _, err = capsys.readouterr()
+    assert err == "--working...\n"
+
+
+def test_status_animation_terminal(itm_nc):
+    itm_nc.quiet = False
+    itm_nc.error_console._force_terminal = True
+    progress = itm_nc._progressfactory("working")
+    assert isinstance(progress, rich.progress.Progress)
+    itm_nc.status_animation = ""
+    progress = itm_nc._progressfactory("working")
+    assert not isinstance(progress, rich.progress.Progress)
+
+
 def test_status_animation_invalid(itm_nc, capsys):
     itm_nc.onecmd_plus_hooks("set status_animation = 'invalid'")
     _, err = capsys.readouterr()
@@ -1209,8 +1346,8 @@ def test_theme_list_toml_err(itm_nc, tmp_path, mocker, capsys):
         pass
 
     # generate errors when loading theme files
-    mock_load = mocker.patch("tomlkit.load")
-    mock_load.side_effect = tomlkit.exceptions.TOMLKitError()
+    mock_load = mocker.patch.object(tomllib, "load")
+    mock_load.side_effect = tomllib.TOMLDecodeError()
     # suppress feedback
     itm_nc.quiet = True
     itm_nc.onecmd_plus_hooks("theme list")
@@ -1234,7 +1371,7 @@ def test_theme_edit_current_theme(itm_nc, tmp_path, mocker, response_with):
     )
     theme_dir_mock.return_value = tmp_path
     # prevent the system call
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
     # mock the network request to the gallery
     response = response_with(404, "")
     mocker.patch("requests.get", return_value=response)
@@ -1243,7 +1380,7 @@ def test_theme_edit_current_theme(itm_nc, tmp_path, mocker, response_with):
     itm_nc.onecmd_plus_hooks("set theme='default-dark'")
     itm_nc.onecmd_plus_hooks("theme edit")
     # but let's check to make sure the editor was called
-    assert mock_os_system.call_count == 1
+    assert mock_run.call_count == 1
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
 
 
@@ -1257,7 +1394,7 @@ def test_theme_edit_named_theme(itm_nc, tmp_path, mocker, response_with):
     )
     theme_dir_mock.return_value = tmp_path
     # prevent the system call
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
     # mock the network request to the gallery
     response = response_with(404, "")
     mocker.patch("requests.get", return_value=response)
@@ -1265,7 +1402,11 @@ def test_theme_edit_named_theme(itm_nc, tmp_path, mocker, response_with):
     itm_nc.onecmd_plus_hooks("theme clone default-light")
     itm_nc.onecmd_plus_hooks("theme edit default-light")
     # but let's check to make sure the editor was called
-    assert mock_os_system.call_count == 1
+    assert mock_run.call_count == 1
+    assert mock_run.call_args.args[0] == [
+        "fooedit",
+        str(tmp_path / "default-light.toml"),
+    ]
     assert itm_nc.exit_code == itm_nc.EXIT_SUCCESS
 
 
@@ -1279,10 +1420,10 @@ def test_theme_edit_builtin(itm_nc, tmp_path, mocker, capsys):
     )
     theme_dir_mock.return_value = tmp_path
     # prevent the system call
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
     itm_nc.onecmd_plus_hooks("theme edit default-light")
     # but let's check to make sure the editor was not called
-    assert mock_os_system.call_count == 0
+    assert mock_run.call_count == 0
     out, err = capsys.readouterr()
     assert itm_nc.exit_code == itm_nc.EXIT_ERROR
     assert "theme is not editable" in err
@@ -1299,10 +1440,10 @@ def test_theme_edit_unknown_theme(itm_nc, tmp_path, mocker, capsys):
     )
     theme_dir_mock.return_value = tmp_path
     # prevent the system call
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
     itm_nc.onecmd_plus_hooks("theme edit bogus")
     # but let's check to make sure the editor was not called
-    assert mock_os_system.call_count == 0
+    assert mock_run.call_count == 0
     out, err = capsys.readouterr()
     assert itm_nc.exit_code == itm_nc.EXIT_ERROR
     assert "unknown theme" in err
@@ -1319,10 +1460,10 @@ def test_theme_edit_no_theme(itm_nc, tmp_path, mocker, capsys):
     )
     theme_dir_mock.return_value = tmp_path
     # prevent the system call
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
     itm_nc.onecmd_plus_hooks("theme edit")
     # but let's check to make sure the editor was not called
-    assert mock_os_system.call_count == 0
+    assert mock_run.call_count == 0
     out, err = capsys.readouterr()
     assert itm_nc.exit_code == itm_nc.EXIT_ERROR
     assert "syntax error: no theme given" in err
@@ -1339,6 +1480,32 @@ def test_theme_edit_no_editor(itm_nc, capsys):
     assert not out
 
 
+def test_theme_edit_missing_editor(itm_nc, tmp_path, mocker, capsys, response_with):
+    # an editor which doesn't exist, so we really try to run it
+    itm_nc.editor = "tomcat-manager-bogus-editor"
+    # point the user theme dir to our temporary directory
+    theme_dir_mock = mocker.patch(
+        "tomcatmanager.InteractiveTomcatManager.user_theme_dir",
+        new_callable=mock.PropertyMock,
+    )
+    theme_dir_mock.return_value = tmp_path
+    # mock the network request to the gallery
+    response = response_with(404, "")
+    mocker.patch("requests.get", return_value=response)
+
+    itm_nc.onecmd_plus_hooks("theme clone default-dark")
+    itm_nc.onecmd_plus_hooks("set theme='default-dark'")
+    capsys.readouterr()
+    # don't reapply the theme if we never edited it
+    apply_mock = mocker.patch("tomcatmanager.InteractiveTomcatManager._apply_theme")
+    itm_nc.onecmd_plus_hooks("theme edit")
+    out, err = capsys.readouterr()
+    assert itm_nc.exit_code == itm_nc.EXIT_ERROR
+    assert not out
+    assert "could not run editor 'tomcat-manager-bogus-editor'" in err
+    assert apply_mock.call_count == 0
+
+
 def test_theme_edit_error_applying(itm_nc, tmp_path, mocker, response_with):
     # if we edit the current theme, we have to reapply it after the editor
     # closes. Simulate an error in applying the theme (i.e. like one that would)
@@ -1358,13 +1525,13 @@ def test_theme_edit_error_applying(itm_nc, tmp_path, mocker, response_with):
     itm_nc.onecmd_plus_hooks("theme clone default-dark")
     itm_nc.onecmd_plus_hooks("set theme='default-dark'")
     # prevent the system call for the edit
-    mock_os_system = mocker.patch("os.system")
+    mock_run = mocker.patch("subprocess.run")
     # and make sure we can't apply the theme
     apply_mock = mocker.patch("tomcatmanager.InteractiveTomcatManager._apply_theme")
     apply_mock.return_value = False
     itm_nc.onecmd_plus_hooks("theme edit")
     # but let's check to make sure the editor was called
-    assert mock_os_system.call_count == 1
+    assert mock_run.call_count == 1
     # we don't check error messages, because those all get generated in _apply_theme
     # but we should have an error for our exit code
     assert itm_nc.exit_code == itm_nc.EXIT_ERROR
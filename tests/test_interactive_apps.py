@@ -334,6 +334,24 @@ def test_list_state_running(itm, mocker, capsys):
     assert out == expected
 
 
+def test_list_raw_no_matching_apps(itm, mocker, capsys):
+    raw_apps = """/:running:0:ROOT
+/manager:running:0:/usr/share/tomcat8-admin/manager
+"""
+    # have to mock this here because it messes up prior commands
+    # if we do it sooner
+    mock_apps = mocker.patch(
+        "tomcatmanager.models.TomcatManagerResponse.result",
+        create=True,
+        new_callable=mock.PropertyMock,
+    )
+    mock_apps.return_value = raw_apps
+    itm.onecmd_plus_hooks("list --raw -s stopped")
+    out, _ = capsys.readouterr()
+    assert out == ""
+    assert itm.exit_code == itm.EXIT_SUCCESS
+
+
 USAGE_ERRORS = [
     "start",
     "stop",
@@ -68,7 +68,7 @@ def test_connect_noparams(capsys):
 
 def test_connect_noverify(tomcat_manager_server, mocker):
     itm = tm.InteractiveTomcatManager()
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(tomcat_manager_server.connect_command + " --noverify")
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -83,7 +83,7 @@ def test_connect_noverify(tomcat_manager_server, mocker):
 
 def test_connect_cacert(tomcat_manager_server, mocker):
     itm = tm.InteractiveTomcatManager()
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(tomcat_manager_server.connect_command + " --cacert /tmp/ca")
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -98,7 +98,7 @@ def test_connect_cacert(tomcat_manager_server, mocker):
 
 def test_connect_cacert_noverify(tomcat_manager_server, mocker):
     itm = tm.InteractiveTomcatManager()
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     cmd = tomcat_manager_server.connect_command + " --cacert /tmp/ca --noverify"
     itm.onecmd_plus_hooks(cmd)
     url = tomcat_manager_server.url + "/text/serverinfo"
@@ -114,7 +114,7 @@ def test_connect_cacert_noverify(tomcat_manager_server, mocker):
 
 def test_connect_cert(tomcat_manager_server, mocker):
     itm = tm.InteractiveTomcatManager()
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(tomcat_manager_server.connect_command + " --cert /tmp/cert")
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -129,7 +129,7 @@ def test_connect_cert(tomcat_manager_server, mocker):
 
 def test_connect_key_cert(tomcat_manager_server, mocker):
     itm = tm.InteractiveTomcatManager()
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     cmd = tomcat_manager_server.connect_command + " --cert /tmp/cert --key /tmp/key"
     itm.onecmd_plus_hooks(cmd)
     url = tomcat_manager_server.url + "/text/serverinfo"
@@ -171,6 +171,7 @@ FAIL_MESSAGES = [
     (requests.codes.ok, "tomcat manager not found"),
     (requests.codes.not_found, "tomcat manager not found"),
     (requests.codes.server_error, "http error"),
+    (599, "http error: 599 Unknown"),
 ]
 
 
@@ -266,7 +267,7 @@ def test_connect_config_user_override(tomcat_manager_server, itm_with_config, mo
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name} someotheruser"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -291,7 +292,7 @@ def test_connect_config_user_password_override(
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name} someotheruser someotherpassword"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -313,7 +314,7 @@ def test_connect_config_cert(tomcat_manager_server, itm_with_config, mocker):
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name}"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -335,7 +336,7 @@ def test_connect_config_cert_override(tomcat_manager_server, itm_with_config, mo
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name} --cert /tmp/yourcert"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -358,7 +359,7 @@ def test_connect_config_cert_key(tomcat_manager_server, itm_with_config, mocker)
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name}"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -383,7 +384,7 @@ def test_connect_config_cert_key_override(
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name} --cert /tmp/yourcert --key /tmp/yourkey"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -407,7 +408,7 @@ def test_connect_config_cacert(tomcat_manager_server, itm_with_config, mocker):
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name}"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -431,7 +432,7 @@ def test_connect_config_cacert_override(tomcat_manager_server, itm_with_config,
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name} --cacert /tmp/other"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -457,7 +458,7 @@ def test_connect_config_noverify_override(
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_nanme} --noverify"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
@@ -483,7 +484,7 @@ def test_connect_config_noverify_override_cacert(
         """
     itm = itm_with_config(config_string)
     cmdline = f"connect {host_name} --noverify"
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     itm.onecmd_plus_hooks(cmdline)
     url = tomcat_manager_server.url + "/text/serverinfo"
     get_mock.assert_called_once_with(
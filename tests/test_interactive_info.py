@@ -137,10 +137,12 @@ def test_resources_class_name(itm, capsys):
     assert not out.strip()
 
 
-def test_findleakers(itm):
+def test_findleakers(itm, capsys):
     itm.exit_code = itm.EXIT_ERROR
     itm.onecmd_plus_hooks("findleakers")
+    out, _ = capsys.readouterr()
     assert itm.exit_code == itm.EXIT_SUCCESS
+    assert out == "/leaker1\n/leaker2\n"
 
 
 ###
@@ -95,7 +95,7 @@ def test_connect_passwdauth(tomcat_manager_server):
 
 
 def test_connect_certauth(tomcat_manager_server, mocker):
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     tomcat = tm.TomcatManager()
     assert tomcat.is_connected is False
     assert not tomcat.tomcat_major_minor
@@ -117,7 +117,7 @@ def test_connect_certauth(tomcat_manager_server, mocker):
 
 
 def test_connect_certkeyauth(tomcat_manager_server, mocker):
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     tomcat = tm.TomcatManager()
     assert tomcat.is_connected is False
     assert not tomcat.tomcat_major_minor
@@ -139,7 +139,7 @@ def test_connect_certkeyauth(tomcat_manager_server, mocker):
 
 
 def test_connect_verifybundle(tomcat_manager_server, mocker):
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     tomcat = tm.TomcatManager()
     assert tomcat.is_connected is False
     assert not tomcat.tomcat_major_minor
@@ -161,7 +161,7 @@ def test_connect_verifybundle(tomcat_manager_server, mocker):
 
 
 def test_connect_noverify(tomcat_manager_server, mocker):
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     tomcat = tm.TomcatManager()
     assert tomcat.is_connected is False
     assert not tomcat.tomcat_major_minor
@@ -183,7 +183,7 @@ def test_connect_noverify(tomcat_manager_server, mocker):
 
 
 def test_connect_connection_error(tomcat_manager_server, mocker):
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     get_mock.side_effect = requests.exceptions.ConnectionError()
     tomcat = tm.TomcatManager()
     assert tomcat.is_connected is False
@@ -205,7 +205,7 @@ def test_connect_connection_error(tomcat_manager_server, mocker):
 
 
 def test_connect_timeout(tomcat_manager_server, mocker):
-    get_mock = mocker.patch("requests.get")
+    get_mock = mocker.patch("requests.Session.get")
     get_mock.side_effect = requests.exceptions.Timeout()
     tomcat = tm.TomcatManager()
     assert tomcat.is_connected is False
@@ -250,6 +250,13 @@ def test_is_connected_true(tomcat):
     assert tomcat.is_connected is True
 
 
+def test_requests_share_session(tomcat, mocker):
+    get_spy = mocker.spy(tomcat._session, "get")
+    tomcat.server_info()
+    tomcat.list()
+    assert get_spy.call_count == 2
+
+
 ###
 #
 # disconnect
@@ -259,3 +266,33 @@ def test_disconnect(tomcat):
     assert tomcat.is_connected is True
     tomcat.disconnect()
     assert tomcat.is_connected is False
+
+
+def test_disconnect_clears_session(tomcat, mocker):
+    close_spy = mocker.spy(tomcat._session, "close")
+    tomcat._session.cookies.set("JSESSIONID", "somesession")
+    tomcat.disconnect()
+    assert close_spy.call_count == 1
+    assert not tomcat._session.cookies
+
+
+def test_close(tomcat, mocker):
+    close_spy = mocker.spy(tomcat._session, "close")
+    tomcat.close()
+    assert close_spy.call_count == 1
+    assert tomcat.is_connected is False
+
+
+def test_context_manager(tomcat_manager_server, mocker):
+    with tm.TomcatManager() as tomcat:
+        close_spy = mocker.spy(tomcat._session, "close")
+        r = tomcat.connect(
+            tomcat_manager_server.url,
+            tomcat_manager_server.user,
+            tomcat_manager_server.password,
+        )
+        assert r.ok
+        close_spy.reset_mock()
+        assert tomcat.is_connected is True
+    assert close_spy.call_count == 1
+    assert tomcat.is_connected is False
@@ -84,7 +84,7 @@ def test_implemented_by_decorations8_0(mocker):
     # don't care if this errors because all we care is that the decorator
     # allowed us to try and make a HTTP request. Functionality of the
     # decorated method is tested elsewhere
-    gmock = mocker.patch("requests.get")
+    gmock = mocker.patch("requests.Session.get")
     gmock.side_effect = requests.HTTPError
 
     with pytest.raises(ValueError):
@@ -184,7 +184,7 @@ def test_implemented_by_decorations_short(
     # don't care if this errors because all we care is that the decorator
     # allowed us to try and make a HTTP request. Functionality of the
     # decorated method is tested elsewhere
-    gmock = mocker.patch("requests.get")
+    gmock = mocker.patch("requests.Session.get")
     gmock.side_effect = requests.HTTPError
 
     with pytest.raises(exc):